@@ -147,6 +147,36 @@ namespace Scheduling.Tests
             Assert.Contains(locations, l => l.Name == "Location2");
             Assert.Contains(locations, l => l.Name == "Location3");
         }
+
+        [Fact]
+        public void GetAllArray_ShouldReturnAllLocations()
+        {
+            // Arrange
+            Location.Create("Location1");
+            Location.Create("Location2");
+
+            // Act
+            var locations = Location.GetAllArray();
+
+            // Assert
+            Assert.Equal(Location.GetAll().Count(), locations.Length);
+            Assert.Contains(locations, x => x.Name == "Location1");
+            Assert.Contains(locations, x => x.Name == "Location2");
+        }
+
+        [Fact]
+        public void GetAllNames_ShouldReturnNamesOfAllLocations()
+        {
+            // Arrange
+            Location.Create("Location1");
+            Location.Create("Location2");
+
+            // Act
+            var names = Location.GetAllNames();
+
+            // Assert
+            Assert.Equal(Location.GetAll().Select(x => x.Name), names);
+        }
     }
 }
 
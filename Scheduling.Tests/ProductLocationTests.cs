@@ -296,6 +296,56 @@ namespace Scheduling.Tests
             Assert.All(productLocations, pl => Assert.Equal(locationName, pl.LocationName));
         }
 
+        [Fact]
+        public void GetAllArray_ShouldReturnAllProductLocations()
+        {
+            // Arrange
+            ProductLocation.Create("Product1", "Location1");
+            ProductLocation.Create("Product2", "Location2");
+
+            // Act
+            var productLocations = ProductLocation.GetAllArray();
+
+            // Assert
+            Assert.Equal(ProductLocation.GetAll().Count(), productLocations.Length);
+            Assert.Contains(productLocations, pl => pl.Key == "Product1@Location1");
+            Assert.Contains(productLocations, pl => pl.Key == "Product2@Location2");
+        }
+
+        [Fact]
+        public void GetByProductArray_ShouldMatchGetByProduct()
+        {
+            // Arrange
+            var productName = "ArrayProduct";
+            ProductLocation.Create(productName, "Location1");
+            ProductLocation.Create(productName, "Location2");
+            ProductLocation.Create("OtherProduct", "Location1");
+
+            // Act
+            var productLocations = ProductLocation.GetByProductArray(productName);
+
+            // Assert
+            Assert.Equal(ProductLocation.GetByProduct(productName), productLocations);
+            Assert.All(productLocations, pl => Assert.Equal(productName, pl.ProductName));
+        }
+
+        [Fact]
+        public void GetByLocationArray_ShouldMatchGetByLocation()
+        {
+            // Arrange
+            var locationName = "ArrayLocation";
+            ProductLocation.Create("Product1", locationName);
+            ProductLocation.Create("Product2", locationName);
+            ProductLocation.Create("Product1", "OtherLocation");
+
+            // Act
+            var productLocations = ProductLocation.GetByLocationArray(locationName);
+
+            // Assert
+            Assert.Equal(ProductLocation.GetByLocation(locationName), productLocations);
+            Assert.All(productLocations, pl => Assert.Equal(locationName, pl.LocationName));
+        }
+
         [Fact]
         public void Create_WithNamesAndObjects_ShouldCreateSameProductLocation()
         {
@@ -533,6 +583,38 @@ namespace Scheduling.Tests
             Assert.Empty(changes);
         }
 
+        [Fact]
+        public void GetAllInventoryChangesTicks_ShouldReturnParallelArraysInChronologicalOrder()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct19", "InventoryLocation19");
+            var time1 = new DateTime(2025, 1, 1, 12, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 8, 0, 0);
+            productLocation.AddInventory(time1, 100.0);
+            productLocation.RemoveInventory(time2, 25.0);
+
+            // Act
+            productLocation.GetAllInventoryChangesTicks(out var ticks, out var deltas);
+
+            // Assert
+            Assert.Equal(new[] { time2.Ticks, time1.Ticks }, ticks);
+            Assert.Equal(new[] { -25.0, 100.0 }, deltas);
+        }
+
+        [Fact]
+        public void GetAllInventoryChangesTicks_WithNoChanges_ShouldReturnEmptyArrays()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct20", "InventoryLocation20");
+
+            // Act
+            productLocation.GetAllInventoryChangesTicks(out var ticks, out var deltas);
+
+            // Assert
+            Assert.Empty(ticks);
+            Assert.Empty(deltas);
+        }
+
         [Fact]
         public void GetInventoryChangesInRange_ShouldReturnOnlyChangesInRange()
         {
@@ -580,6 +662,209 @@ namespace Scheduling.Tests
             Assert.Empty(changes);
         }
 
+        [Fact]
+        public void GetInventoryChangesInRangeTicks_ShouldReturnOnlyChangesInRange()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct21", "InventoryLocation21");
+            var time1 = new DateTime(2025, 1, 1, 8, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 12, 0, 0);
+            var time3 = new DateTime(2025, 1, 1, 16, 0, 0);
+            var time4 = new DateTime(2025, 1, 1, 20, 0, 0);
+
+            productLocation.AddInventory(time1, 50.0);
+            productLocation.AddInventory(time2, 100.0);
+            productLocation.RemoveInventory(time3, 75.0);
+            productLocation.AddInventory(time4, 25.0);
+
+            // Act - both bounds are inclusive
+            productLocation.GetInventoryChangesInRangeTicks(time2, time3, out var ticks, out var deltas);
+
+            // Assert
+            Assert.Equal(new[] { time2.Ticks, time3.Ticks }, ticks);
+            Assert.Equal(new[] { 100.0, -75.0 }, deltas);
+        }
+
+        [Fact]
+        public void InventoryOperations_WithTicks_ShouldMatchDateTimeOverloads()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct22", "InventoryLocation22");
+            var time1 = new DateTime(2025, 1, 1, 8, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 12, 0, 0);
+            var time3 = new DateTime(2025, 1, 1, 16, 0, 0);
+
+            // Act
+            productLocation.AddInventory(time1.Ticks, 100.0);
+            productLocation.RemoveInventory(time2.Ticks, 30.0);
+            productLocation.UpdateInventory(time3.Ticks, 10.0);
+
+            // Assert
+            Assert.Equal(100.0, productLocation.GetInventoryChangeAtTime(time1));
+            Assert.Equal(-30.0, productLocation.GetInventoryChangeAtTime(time2.Ticks));
+            Assert.Equal(10.0, productLocation.GetInventoryChangeAtTime(time3.Ticks));
+            Assert.Equal(70.0, productLocation.GetCumulativeInventory(time2.Ticks));
+            Assert.Equal(80.0, productLocation.GetCumulativeInventory(time3));
+        }
+
+        [Fact]
+        public void AddInventory_WithTicksAndZeroQuantity_ShouldThrowArgumentException()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct23", "InventoryLocation23");
+            var ticks = new DateTime(2025, 1, 1, 10, 0, 0).Ticks;
+
+            // Act & Assert
+            Assert.Throws<ArgumentException>(() => productLocation.AddInventory(ticks, 0));
+        }
+
+        [Fact]
+        public void GetInventoryChangesInRangeTicks_WithTickBounds_ShouldMatchDateTimeBounds()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct24", "InventoryLocation24");
+            var time1 = new DateTime(2025, 1, 1, 8, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 12, 0, 0);
+            productLocation.AddInventory(time1, 50.0);
+            productLocation.AddInventory(time2, 100.0);
+            var startTime = new DateTime(2025, 1, 1, 10, 0, 0);
+            var endTime = new DateTime(2025, 1, 1, 18, 0, 0);
+
+            // Act
+            productLocation.GetInventoryChangesInRangeTicks(startTime.Ticks, endTime.Ticks, out var ticks, out var deltas);
+
+            // Assert
+            Assert.Equal(new[] { time2.Ticks }, ticks);
+            Assert.Equal(new[] { 100.0 }, deltas);
+        }
+
+        [Fact]
+        public void AddInventoryBatch_ShouldAddEachQuantityAtItsTime()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct25", "InventoryLocation25");
+            var time1 = new DateTime(2025, 1, 1, 8, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 12, 0, 0);
+
+            // Act
+            productLocation.AddInventoryBatch(new[] { time1.Ticks, time2.Ticks, time1.Ticks }, new[] { 100.0, 50.0, 25.0 });
+
+            // Assert
+            Assert.Equal(125.0, productLocation.GetInventoryChangeAtTime(time1));
+            Assert.Equal(50.0, productLocation.GetInventoryChangeAtTime(time2));
+        }
+
+        [Fact]
+        public void AddInventoryBatch_WithMismatchedLengths_ShouldThrowArgumentException()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct26", "InventoryLocation26");
+            var ticks = new[] { new DateTime(2025, 1, 1, 8, 0, 0).Ticks };
+
+            // Act & Assert
+            Assert.Throws<ArgumentException>(() => productLocation.AddInventoryBatch(ticks, new[] { 10.0, 20.0 }));
+        }
+
+        [Fact]
+        public void AddInventoryBatch_WithNonPositiveQuantity_ShouldNotAddAnything()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct27", "InventoryLocation27");
+            var time1 = new DateTime(2025, 1, 1, 8, 0, 0);
+            var time2 = new DateTime(2025, 1, 1, 12, 0, 0);
+
+            // Act & Assert
+            Assert.Throws<ArgumentException>(() =>
+                productLocation.AddInventoryBatch(new[] { time1.Ticks, time2.Ticks }, new[] { 10.0, 0.0 }));
+            Assert.Empty(productLocation.GetAllInventoryChanges());
+        }
+
+        [Fact]
+        public void AddInventoryBatch_WithTickOutsideDateTimeRange_ShouldNotAddAnything()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct33", "InventoryLocation33");
+            var validTicks = new DateTime(2025, 1, 1, 8, 0, 0).Ticks;
+
+            // Act & Assert
+            Assert.Throws<ArgumentOutOfRangeException>(() =>
+                productLocation.AddInventoryBatch(new[] { validTicks, DateTime.MaxValue.Ticks + 1 }, new[] { 10.0, 20.0 }));
+            Assert.Throws<ArgumentOutOfRangeException>(() =>
+                productLocation.AddInventoryBatch(new[] { validTicks, -1L }, new[] { 10.0, 20.0 }));
+            Assert.Empty(productLocation.GetAllInventoryChanges());
+        }
+
+        [Fact]
+        public void AddInventoryLinear_ShouldAddQuantitiesAtEvenlySpacedTimes()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct28", "InventoryLocation28");
+            var baseTime = new DateTime(2025, 1, 1, 8, 0, 0);
+            var step = TimeSpan.FromHours(1);
+
+            // Act
+            productLocation.AddInventoryLinear(baseTime.Ticks, step.Ticks, new[] { 10.0, 20.0, 30.0 });
+
+            // Assert
+            var changes = productLocation.GetAllInventoryChanges();
+            Assert.Equal(3, changes.Count);
+            Assert.Equal(baseTime, changes[0].Time);
+            Assert.Equal(baseTime + step, changes[1].Time);
+            Assert.Equal(baseTime + step + step, changes[2].Time);
+            Assert.Equal(60.0, productLocation.GetCumulativeInventory(baseTime + step + step));
+        }
+
+        [Fact]
+        public void AddInventoryLinear_WithNonPositiveStep_ShouldThrowArgumentException()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct29", "InventoryLocation29");
+            var baseTicks = new DateTime(2025, 1, 1, 8, 0, 0).Ticks;
+
+            // Act & Assert
+            Assert.Throws<ArgumentException>(() => productLocation.AddInventoryLinear(baseTicks, 0, new[] { 10.0 }));
+        }
+
+        [Fact]
+        public void AddInventoryLinear_PastMaxDateTime_ShouldThrowAndNotAddAnything()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct30", "InventoryLocation30");
+            var baseTicks = new DateTime(9999, 12, 31, 22, 0, 0).Ticks;
+            var stepTicks = TimeSpan.FromHours(1).Ticks;
+
+            // Act & Assert - the third receipt would fall after DateTime.MaxValue
+            Assert.Throws<ArgumentOutOfRangeException>(() =>
+                productLocation.AddInventoryLinear(baseTicks, stepTicks, new[] { 1.0, 2.0, 3.0 }));
+            Assert.Empty(productLocation.GetAllInventoryChanges());
+        }
+
+        [Fact]
+        public void AddInventoryLinear_WithNegativeBaseTicks_ShouldThrowArgumentOutOfRangeException()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct31", "InventoryLocation31");
+
+            // Act & Assert
+            Assert.Throws<ArgumentOutOfRangeException>(() =>
+                productLocation.AddInventoryLinear(-1, TimeSpan.FromHours(1).Ticks, new[] { 1.0 }));
+        }
+
+        [Fact]
+        public void AddInventoryLinear_EndingExactlyAtMaxDateTime_ShouldSucceed()
+        {
+            // Arrange
+            var productLocation = ProductLocation.Create("InventoryProduct32", "InventoryLocation32");
+            var stepTicks = TimeSpan.FromHours(1).Ticks;
+            var baseTicks = DateTime.MaxValue.Ticks - stepTicks;
+
+            // Act
+            productLocation.AddInventoryLinear(baseTicks, stepTicks, new[] { 1.0, 2.0 });
+
+            // Assert
+            Assert.Equal(2.0, productLocation.GetInventoryChangeAtTime(DateTime.MaxValue));
+        }
+
         [Fact]
         public void InventoryProfile_ShouldBeAccessible()
         {
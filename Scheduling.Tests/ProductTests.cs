@@ -147,6 +147,36 @@ namespace Scheduling.Tests
             Assert.Contains(products, p => p.Name == "Product2");
             Assert.Contains(products, p => p.Name == "Product3");
         }
+
+        [Fact]
+        public void GetAllArray_ShouldReturnAllProducts()
+        {
+            // Arrange
+            Product.Create("Product1");
+            Product.Create("Product2");
+
+            // Act
+            var products = Product.GetAllArray();
+
+            // Assert
+            Assert.Equal(Product.GetAll().Count(), products.Length);
+            Assert.Contains(products, x => x.Name == "Product1");
+            Assert.Contains(products, x => x.Name == "Product2");
+        }
+
+        [Fact]
+        public void GetAllNames_ShouldReturnNamesOfAllProducts()
+        {
+            // Arrange
+            Product.Create("Product1");
+            Product.Create("Product2");
+
+            // Act
+            var names = Product.GetAllNames();
+
+            // Assert
+            Assert.Equal(Product.GetAll().Select(x => x.Name), names);
+        }
     }
 }
 
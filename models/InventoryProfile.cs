@@ -119,6 +119,26 @@ namespace Scheduling.Models
             return _inventoryChanges.Select(kvp => (kvp.Key, kvp.Value)).ToList();
         }
 
+        /// <summary>
+        /// Gets all inventory changes in chronological order as parallel primitive arrays.
+        /// Intended for interop callers that want to copy the whole profile in one call.
+        /// </summary>
+        /// <param name="ticks">Receives the time of each change as <see cref="DateTime.Ticks"/></param>
+        /// <param name="netChanges">Receives the net change at the matching index</param>
+        public void GetAllChangesTicks(out long[] ticks, out double[] netChanges)
+        {
+            ticks = new long[_inventoryChanges.Count];
+            netChanges = new double[_inventoryChanges.Count];
+
+            var i = 0;
+            foreach (var kvp in _inventoryChanges)
+            {
+                ticks[i] = kvp.Key.Ticks;
+                netChanges[i] = kvp.Value;
+                i++;
+            }
+        }
+
         /// <summary>
         /// Gets all inventory changes within a time range.
         /// </summary>
@@ -133,6 +153,36 @@ namespace Scheduling.Models
                 .ToList();
         }
 
+        /// <summary>
+        /// Gets all inventory changes within a time range as parallel primitive arrays.
+        /// </summary>
+        /// <param name="startTime">Start of the time range (inclusive)</param>
+        /// <param name="endTime">End of the time range (inclusive)</param>
+        /// <param name="ticks">Receives the time of each change as <see cref="DateTime.Ticks"/></param>
+        /// <param name="netChanges">Receives the net change at the matching index</param>
+        public void GetChangesInRangeTicks(DateTime startTime, DateTime endTime, out long[] ticks, out double[] netChanges)
+        {
+            var rangeTicks = new List<long>();
+            var rangeChanges = new List<double>();
+
+            foreach (var kvp in _inventoryChanges)
+            {
+                if (kvp.Key > endTime)
+                {
+                    break;
+                }
+
+                if (kvp.Key >= startTime)
+                {
+                    rangeTicks.Add(kvp.Key.Ticks);
+                    rangeChanges.Add(kvp.Value);
+                }
+            }
+
+            ticks = rangeTicks.ToArray();
+            netChanges = rangeChanges.ToArray();
+        }
+
         /// <summary>
         /// Removes an inventory change at a specific time.
         /// </summary>
@@ -77,6 +77,28 @@ namespace Scheduling.Models
             return _locations.Values;
         }
 
+        /// <summary>
+        /// Gets all locations as an array.
+        /// </summary>
+        /// <returns>An array of all locations</returns>
+        public static Location[] GetAllArray()
+        {
+            var result = new Location[_locations.Count];
+            _locations.Values.CopyTo(result, 0);
+            return result;
+        }
+
+        /// <summary>
+        /// Gets the names of all locations.
+        /// </summary>
+        /// <returns>An array of all location names</returns>
+        public static string[] GetAllNames()
+        {
+            var result = new string[_locations.Count];
+            _locations.Keys.CopyTo(result, 0);
+            return result;
+        }
+
         /// <summary>
         /// Clears all locations. Useful for testing.
         /// </summary>
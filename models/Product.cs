@@ -78,6 +78,29 @@ namespace Scheduling.Models
             return _products.Values;
         }
 
+        /// <summary>
+        /// Gets all products as an array.
+        /// Interop callers can copy an array in one call instead of enumerating element by element.
+        /// </summary>
+        /// <returns>An array of all products</returns>
+        public static Product[] GetAllArray()
+        {
+            var result = new Product[_products.Count];
+            _products.Values.CopyTo(result, 0);
+            return result;
+        }
+
+        /// <summary>
+        /// Gets the names of all products.
+        /// </summary>
+        /// <returns>An array of all product names</returns>
+        public static string[] GetAllNames()
+        {
+            var result = new string[_products.Count];
+            _products.Keys.CopyTo(result, 0);
+            return result;
+        }
+
         /// <summary>
         /// Clears all products. Useful for testing.
         /// </summary>
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Linq;
 
 namespace Scheduling.Models
 {
@@ -179,6 +180,37 @@ namespace Scheduling.Models
             }
         }
 
+        /// <summary>
+        /// Gets all ProductLocations as an array.
+        /// </summary>
+        /// <returns>An array of all ProductLocations</returns>
+        public static ProductLocation[] GetAllArray()
+        {
+            var result = new ProductLocation[_productLocations.Count];
+            _productLocations.Values.CopyTo(result, 0);
+            return result;
+        }
+
+        /// <summary>
+        /// Gets all ProductLocations for a specific product as an array.
+        /// </summary>
+        /// <param name="productName">The name of the product</param>
+        /// <returns>An array of ProductLocations for the product</returns>
+        public static ProductLocation[] GetByProductArray(string productName)
+        {
+            return GetByProduct(productName).ToArray();
+        }
+
+        /// <summary>
+        /// Gets all ProductLocations for a specific location as an array.
+        /// </summary>
+        /// <param name="locationName">The name of the location</param>
+        /// <returns>An array of ProductLocations for the location</returns>
+        public static ProductLocation[] GetByLocationArray(string locationName)
+        {
+            return GetByLocation(locationName).ToArray();
+        }
+
         // Inventory Management Methods
 
         /// <summary>
@@ -191,6 +223,114 @@ namespace Scheduling.Models
             _inventoryProfile.AddInventory(time, quantity);
         }
 
+        /// <summary>
+        /// Adds inventory at a time given as <see cref="DateTime.Ticks"/>.
+        /// Lets interop callers pass a primitive instead of constructing a DateTime per call.
+        /// </summary>
+        /// <param name="ticks">The time when inventory is added, in ticks</param>
+        /// <param name="quantity">The quantity to add</param>
+        public void AddInventory(long ticks, double quantity)
+        {
+            _inventoryProfile.AddInventory(new DateTime(ticks), quantity);
+        }
+
+        /// <summary>
+        /// Adds a batch of inventory receipts in a single call.
+        /// All quantities and times are validated before any inventory is added.
+        /// </summary>
+        /// <param name="ticks">The time of each receipt as <see cref="DateTime.Ticks"/></param>
+        /// <param name="quantities">The quantity to add at the matching index</param>
+        public void AddInventoryBatch(long[] ticks, double[] quantities)
+        {
+            if (ticks == null)
+            {
+                throw new ArgumentNullException(nameof(ticks));
+            }
+
+            if (quantities == null)
+            {
+                throw new ArgumentNullException(nameof(quantities));
+            }
+
+            if (ticks.Length != quantities.Length)
+            {
+                throw new ArgumentException("Ticks and quantities must have the same length.", nameof(quantities));
+            }
+
+            ValidateBatchTicks(ticks);
+            ValidateBatchQuantities(quantities);
+
+            for (int i = 0; i < ticks.Length; i++)
+            {
+                _inventoryProfile.AddInventory(new DateTime(ticks[i]), quantities[i]);
+            }
+        }
+
+        /// <summary>
+        /// Adds inventory on an equally spaced schedule: quantities[i] is added at baseTicks + i * stepTicks.
+        /// All quantities and times are validated before any inventory is added.
+        /// </summary>
+        /// <param name="baseTicks">The time of the first receipt as <see cref="DateTime.Ticks"/></param>
+        /// <param name="stepTicks">The spacing between receipts in ticks (must be positive)</param>
+        /// <param name="quantities">The quantity to add at each step</param>
+        public void AddInventoryLinear(long baseTicks, long stepTicks, double[] quantities)
+        {
+            if (quantities == null)
+            {
+                throw new ArgumentNullException(nameof(quantities));
+            }
+
+            if (stepTicks <= 0)
+            {
+                throw new ArgumentException("Step must be positive.", nameof(stepTicks));
+            }
+
+            ValidateBatchQuantities(quantities);
+
+            if (quantities.Length > 0)
+            {
+                if (baseTicks < 0 || baseTicks > DateTime.MaxValue.Ticks)
+                {
+                    throw new ArgumentOutOfRangeException(nameof(baseTicks), "Base time is outside the range of DateTime.");
+                }
+
+                // Written as a division so the last time is checked without overflowing
+                if ((DateTime.MaxValue.Ticks - baseTicks) / stepTicks < quantities.Length - 1)
+                {
+                    throw new ArgumentOutOfRangeException(nameof(stepTicks), "Schedule extends past the range of DateTime.");
+                }
+            }
+
+            var ticks = baseTicks;
+            for (int i = 0; i < quantities.Length; i++)
+            {
+                _inventoryProfile.AddInventory(new DateTime(ticks), quantities[i]);
+                ticks += stepTicks;
+            }
+        }
+
+        private static void ValidateBatchTicks(long[] ticks)
+        {
+            foreach (var tick in ticks)
+            {
+                if (tick < 0 || tick > DateTime.MaxValue.Ticks)
+                {
+                    throw new ArgumentOutOfRangeException(nameof(ticks), "Time is outside the range of DateTime.");
+                }
+            }
+        }
+
+        private static void ValidateBatchQuantities(double[] quantities)
+        {
+            foreach (var quantity in quantities)
+            {
+                if (quantity <= 0)
+                {
+                    throw new ArgumentException("Quantity must be positive when adding inventory.", nameof(quantities));
+                }
+            }
+        }
+
         /// <summary>
         /// Removes inventory at a specific time.
         /// </summary>
@@ -201,6 +341,16 @@ namespace Scheduling.Models
             _inventoryProfile.RemoveInventory(time, quantity);
         }
 
+        /// <summary>
+        /// Removes inventory at a time given as <see cref="DateTime.Ticks"/>.
+        /// </summary>
+        /// <param name="ticks">The time when inventory is removed, in ticks</param>
+        /// <param name="quantity">The quantity to remove</param>
+        public void RemoveInventory(long ticks, double quantity)
+        {
+            _inventoryProfile.RemoveInventory(new DateTime(ticks), quantity);
+        }
+
         /// <summary>
         /// Updates inventory change at a specific time.
         /// </summary>
@@ -211,6 +361,16 @@ namespace Scheduling.Models
             _inventoryProfile.UpdateInventory(time, netChange);
         }
 
+        /// <summary>
+        /// Updates inventory change at a time given as <see cref="DateTime.Ticks"/>.
+        /// </summary>
+        /// <param name="ticks">The time of the inventory change, in ticks</param>
+        /// <param name="netChange">The net change in inventory</param>
+        public void UpdateInventory(long ticks, double netChange)
+        {
+            _inventoryProfile.UpdateInventory(new DateTime(ticks), netChange);
+        }
+
         /// <summary>
         /// Gets the cumulative inventory level at a specific time.
         /// </summary>
@@ -221,6 +381,16 @@ namespace Scheduling.Models
             return _inventoryProfile.GetCumulativeInventory(time);
         }
 
+        /// <summary>
+        /// Gets the cumulative inventory level at a time given as <see cref="DateTime.Ticks"/>.
+        /// </summary>
+        /// <param name="ticks">The time to query, in ticks</param>
+        /// <returns>The cumulative inventory level</returns>
+        public double GetCumulativeInventory(long ticks)
+        {
+            return _inventoryProfile.GetCumulativeInventory(new DateTime(ticks));
+        }
+
         /// <summary>
         /// Gets the inventory change at a specific time.
         /// </summary>
@@ -231,6 +401,16 @@ namespace Scheduling.Models
             return _inventoryProfile.GetInventoryChangeAtTime(time);
         }
 
+        /// <summary>
+        /// Gets the inventory change at a time given as <see cref="DateTime.Ticks"/>.
+        /// </summary>
+        /// <param name="ticks">The time to query, in ticks</param>
+        /// <returns>The net change at that time</returns>
+        public double GetInventoryChangeAtTime(long ticks)
+        {
+            return _inventoryProfile.GetInventoryChangeAtTime(new DateTime(ticks));
+        }
+
         /// <summary>
         /// Gets all inventory changes for this product location.
         /// </summary>
@@ -240,6 +420,16 @@ namespace Scheduling.Models
             return _inventoryProfile.GetAllChanges();
         }
 
+        /// <summary>
+        /// Gets all inventory changes as parallel arrays of ticks and net changes.
+        /// </summary>
+        /// <param name="ticks">Receives the time of each change as <see cref="DateTime.Ticks"/></param>
+        /// <param name="deltas">Receives the net change at the matching index</param>
+        public void GetAllInventoryChangesTicks(out long[] ticks, out double[] deltas)
+        {
+            _inventoryProfile.GetAllChangesTicks(out ticks, out deltas);
+        }
+
         /// <summary>
         /// Gets inventory changes within a time range.
         /// </summary>
@@ -251,6 +441,30 @@ namespace Scheduling.Models
             return _inventoryProfile.GetChangesInRange(startTime, endTime);
         }
 
+        /// <summary>
+        /// Gets inventory changes within a time range as parallel arrays of ticks and net changes.
+        /// </summary>
+        /// <param name="startTime">Start time (inclusive)</param>
+        /// <param name="endTime">End time (inclusive)</param>
+        /// <param name="ticks">Receives the time of each change as <see cref="DateTime.Ticks"/></param>
+        /// <param name="deltas">Receives the net change at the matching index</param>
+        public void GetInventoryChangesInRangeTicks(DateTime startTime, DateTime endTime, out long[] ticks, out double[] deltas)
+        {
+            _inventoryProfile.GetChangesInRangeTicks(startTime, endTime, out ticks, out deltas);
+        }
+
+        /// <summary>
+        /// Gets inventory changes within a range given as <see cref="DateTime.Ticks"/>.
+        /// </summary>
+        /// <param name="startTicks">Start time in ticks (inclusive)</param>
+        /// <param name="endTicks">End time in ticks (inclusive)</param>
+        /// <param name="ticks">Receives the time of each change as <see cref="DateTime.Ticks"/></param>
+        /// <param name="deltas">Receives the net change at the matching index</param>
+        public void GetInventoryChangesInRangeTicks(long startTicks, long endTicks, out long[] ticks, out double[] deltas)
+        {
+            _inventoryProfile.GetChangesInRangeTicks(new DateTime(startTicks), new DateTime(endTicks), out ticks, out deltas);
+        }
+
         /// <summary>
         /// Sets the producing operation for this product location.
         /// </summary>
@@ -3,6 +3,9 @@ Debug utilities for Python + C# debugging.
 Provides helper functions to attach both Python and C# debuggers.
 """
 
+import os
+import sys
+
 import scheduling_py as sched
 
 
@@ -47,6 +50,10 @@ def csharp_debug_attach(timeout_seconds: int = 60, show_dots: bool = True):
     This will pause execution and wait for a .NET debugger to attach
     to the Python process (which is hosting the .NET runtime).
     
+    Returns immediately if a debugger is already attached. The wait is
+    skipped in non-interactive runs (stdin is not a TTY) or when the
+    SCHED_NO_DEBUG environment variable is set, e.g. in CI.
+    
     Args:
         timeout_seconds: Maximum time to wait for debugger (default: 60 seconds)
         show_dots: Show progress dots while waiting (default: True)
@@ -73,6 +80,14 @@ def csharp_debug_attach(timeout_seconds: int = 60, show_dots: bool = True):
         # Now C# breakpoints will hit
         product = sched.Product.create("Widget")
     """
+    if sched.DebugHelper.is_debugger_attached():
+        print("[C# Debug] ✓ C# Debugger already attached.\n")
+        return True
+    
+    if os.environ.get("SCHED_NO_DEBUG") or sys.stdin is None or not sys.stdin.isatty():
+        print("[C# Debug] Non-interactive session, skipping wait for .NET debugger.\n")
+        return False
+    
     print("\n" + "=" * 60)
     print("[C# Debug] Waiting for .NET Debugger")
     print("=" * 60)
@@ -2,6 +2,7 @@
 Example usage of the Scheduling C# library from Python.
 """
 
+import sys
 from datetime import datetime, timedelta
 import scheduling_py as sched
 from debug_utils import python_debug_attach, csharp_debug_attach
@@ -34,8 +35,8 @@ def main():
     
     # Get all products
     print(f"\nAll products:")
-    for product in sched.Product.get_all():
-        print(f"  - {product.Name}")
+    for name in sched.Product.get_all_names():
+        print(f"  - {name}")
     
     # ==================== Location Operations ====================
     print("\n--- Creating Locations ---")
@@ -49,8 +50,8 @@ def main():
     
     # Get all locations
     print(f"\nAll locations:")
-    for location in sched.Location.get_all():
-        print(f"  - {location.Name}")
+    for name in sched.Location.get_all_names():
+        print(f"  - {name}")
     
     # ==================== ProductLocation Operations ====================
     print("\n--- Creating ProductLocations ---")
@@ -94,7 +95,8 @@ def main():
     print(f"  {base_time + timedelta(hours=6)}: +75 units")
     
     # Get cumulative inventory at different times
-    print(f"\nCumulative inventory levels:")
+    # Output for each report is collected and written once
+    buf = ["\nCumulative inventory levels:"]
     query_times = [
         base_time + timedelta(hours=1),
         base_time + timedelta(hours=3),
@@ -104,23 +106,27 @@ def main():
     
     for qt in query_times:
         cumulative = sched.get_cumulative_inventory(pl1, qt)
-        print(f"  At {qt}: {cumulative} units")
+        buf.append(f"  At {qt}: {cumulative} units")
+    sys.stdout.write("\n".join(buf) + "\n")
     
     # Get all inventory changes
-    print(f"\nAll inventory changes for {pl1.Key}:")
-    all_changes = sched.get_all_inventory_changes(pl1)
-    for time, net_change in all_changes:
+    buf = [f"\nAll inventory changes for {pl1.Key}:"]
+    # Only printed, so read raw ticks instead of building datetimes
+    all_changes = sched.get_all_inventory_changes_raw(pl1)
+    for ticks, net_change in all_changes:
         sign = "+" if net_change >= 0 else ""
-        print(f"  {time}: {sign}{net_change} units")
+        buf.append(f"  {sched.ticks_to_iso(ticks, sep=' ')}: {sign}{net_change} units")
+    sys.stdout.write("\n".join(buf) + "\n")
     
     # Get inventory changes in a specific range
     start = base_time + timedelta(hours=1)
     end = base_time + timedelta(hours=5)
-    print(f"\nInventory changes between {start} and {end}:")
+    buf = [f"\nInventory changes between {start} and {end}:"]
     range_changes = sched.get_inventory_changes_in_range(pl1, start, end)
     for time, net_change in range_changes:
         sign = "+" if net_change >= 0 else ""
-        print(f"  {time}: {sign}{net_change} units")
+        buf.append(f"  {time}: {sign}{net_change} units")
+    sys.stdout.write("\n".join(buf) + "\n")
     
     # ==================== Update Inventory ====================
     print("\n--- Updating Inventory ---")
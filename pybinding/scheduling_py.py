@@ -3,53 +3,100 @@ Python wrapper for Scheduling C# library.
 Provides access to Product, Location, and ProductLocation models.
 """
 
+import logging
 import os
 import sys
-from datetime import datetime
-from pathlib import Path
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Iterable, List, Tuple
 
-# Configure pythonnet for .NET runtime
-import clr_loader
-from pythonnet import set_runtime
+logger = logging.getLogger(__name__)
 
 # Determine build configuration (Debug or Release)
 # Set DOTNET_BUILD_CONFIG=Debug environment variable to load Debug DLL for C# debugging
 build_config = os.environ.get("DOTNET_BUILD_CONFIG", "Release")
-print(f"Loading .NET assemblies from {build_config} build...")
 
-# Enable .NET debugging when in Debug mode
-if build_config == "Debug":
-    # These environment variables enable debugging support in CoreCLR
-    os.environ["COMPlus_ZapDisable"] = "1"  # Disable NGEN/ReadyToRun for better debugging
-    os.environ["COMPlus_ReadyToRun"] = "0"  # Disable ReadyToRun compilation
-    os.environ["DOTNET_JitOptimize"] = "0"  # Disable JIT optimizations
-    print("DEBUG: Enabled .NET debugging support (JIT optimizations disabled)")
-
-# Get the directory containing the DLL (go up one level from pybinding to root)
-dll_dir = Path(__file__).parent.parent / "bin" / build_config / "net8.0"
-dll_path = dll_dir / "Scheduling.dll"
-
-
-if not dll_path.exists():
-    raise FileNotFoundError(
-        f"Could not find Scheduling.dll at {dll_path}. "
-        f"Please build the project first using: dotnet build -c {build_config}"
+# Directory containing the DLL (go up one level from pybinding to root)
+_DLL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin", build_config, "net8.0")
+
+# DateTime.Ticks counts 100-nanosecond intervals since 0001-01-01 00:00:00
+_TICKS_EPOCH = datetime(1, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# The .NET runtime is loaded on first use rather than at import, so importing
+# this module (e.g. from tests or debug scripts) does not pay the DLL load cost.
+_runtime_loaded = False
+
+# add/remove/update inventory -> the C# (long ticks, double) overload, resolved
+# once at runtime load and called unbound with the ProductLocation first
+_INVENTORY_OPS = {}
+
+
+def _ensure_runtime():
+    """Load the .NET runtime and the Scheduling assembly if not already loaded."""
+    global _runtime_loaded
+    global CSharpProduct, CSharpLocation, CSharpProductLocation, CSharpDebugHelper
+    global CSharpDateTime, Array, Double, Int64, IntPtr, Marshal, _RUNTIME_EXPORTS
+
+    if _runtime_loaded:
+        return
+
+    # Configure pythonnet for .NET runtime
+    import clr_loader
+    from pythonnet import set_runtime
+
+    logger.debug("Loading .NET assemblies from %s build...", build_config)
+
+    # Enable .NET debugging when in Debug mode
+    if build_config == "Debug":
+        # These environment variables enable debugging support in CoreCLR.
+        # Only missing ones are set (one putenv each), so values already in
+        # the environment are left alone.
+        debug_env = {
+            "COMPlus_ZapDisable": "1",  # Disable NGEN/ReadyToRun for better debugging
+            "COMPlus_ReadyToRun": "0",  # Disable ReadyToRun compilation
+            "DOTNET_JitOptimize": "0",  # Disable JIT optimizations
+        }
+        os.environ.update({k: v for k, v in debug_env.items() if k not in os.environ})
+        logger.debug("Enabled .NET debugging support (JIT optimizations disabled)")
+
+    dll_path = os.path.join(_DLL_DIR, "Scheduling.dll")
+
+    if not os.path.exists(dll_path):
+        raise FileNotFoundError(
+            f"Could not find Scheduling.dll at {dll_path}. "
+            f"Please build the project first using: dotnet build -c {build_config}"
+        )
+
+    # Set up the .NET runtime
+    runtime_config = os.path.join(_DLL_DIR, "Scheduling.runtimeconfig.json")
+    rt = clr_loader.get_coreclr(runtime_config=runtime_config)
+    set_runtime(rt)
+
+    import clr
+    clr.AddReference(dll_path)
+
+    # Import C# namespaces
+    from Scheduling.Models import Product as CSharpProduct
+    from Scheduling.Models import Location as CSharpLocation
+    from Scheduling.Models import ProductLocation as CSharpProductLocation
+    from Scheduling.Models import DebugHelper as CSharpDebugHelper
+    from System import DateTime as CSharpDateTime
+    from System import Array, Double, Int64, IntPtr
+    from System.Runtime.InteropServices import Marshal
+
+    _INVENTORY_OPS.update(
+        add=CSharpProductLocation.AddInventory.Overloads[Int64, Double],
+        remove=CSharpProductLocation.RemoveInventory.Overloads[Int64, Double],
+        update=CSharpProductLocation.UpdateInventory.Overloads[Int64, Double],
     )
 
-# Set up the .NET runtime
-runtime_config = dll_dir / "Scheduling.runtimeconfig.json"
-rt = clr_loader.get_coreclr(runtime_config=str(runtime_config))
-set_runtime(rt)
-
-import clr
-clr.AddReference(str(dll_path))
-
-# Import C# namespaces
-from Scheduling.Models import Product as CSharpProduct
-from Scheduling.Models import Location as CSharpLocation
-from Scheduling.Models import ProductLocation as CSharpProductLocation
-from Scheduling.Models import DebugHelper as CSharpDebugHelper
-from System import DateTime as CSharpDateTime
+    api = _bind_api()
+    globals().update(api)
+    _RUNTIME_EXPORTS = frozenset(api)
+    _runtime_loaded = True
 
 
 class DebugHelper:
@@ -80,6 +127,7 @@ class DebugHelper:
             # Now call C# code - breakpoints will hit
             product = sched.Product.create("Widget")
         """
+        _ensure_runtime()
         return CSharpDebugHelper.WaitForDebugger(timeout_seconds, show_dots)
     
     @staticmethod
@@ -94,6 +142,7 @@ class DebugHelper:
             sched.DebugHelper.wait_for_debugger()
             sched.DebugHelper.break_here()  # Will break here if debugger attached
         """
+        _ensure_runtime()
         CSharpDebugHelper.Break()
     
     @staticmethod
@@ -104,6 +153,7 @@ class DebugHelper:
         Returns:
             True if debugger is attached, False otherwise
         """
+        _ensure_runtime()
         return CSharpDebugHelper.IsDebuggerAttached()
     
     @staticmethod
@@ -115,162 +165,309 @@ class DebugHelper:
         Returns:
             True if debugger was launched, False otherwise
         """
+        _ensure_runtime()
         return CSharpDebugHelper.LaunchDebugger()
 
 
-class Product:
+class _ProductNamespace(SimpleNamespace):
     """Python wrapper for C# Product class."""
-    
-    @staticmethod
-    def create(name: str):
-        """Create a new product or get existing one."""
-        return CSharpProduct.Create(name)
-    
-    @staticmethod
-    def get(name: str):
-        """Get a product by name."""
-        return CSharpProduct.Get(name)
-    
-    @staticmethod
-    def remove(name: str) -> bool:
+
+
+class _LocationNamespace(SimpleNamespace):
+    """Python wrapper for C# Location class."""
+
+
+class _ProductLocationNamespace(SimpleNamespace):
+    """Python wrapper for C# ProductLocation class."""
+
+
+def _bind_api() -> dict:
+    """
+    Build the Product, Location and ProductLocation wrappers.
+
+    get, exists, get_by_key and the Product/Location create are the C#
+    methods themselves (no Python frame per call), because their C#
+    parameter is already called name or key. remove, the get_all* listings
+    and every wrapper taking product_name/location_name stay thin defs, so
+    those documented Python keyword names keep working. Each namespace is a
+    SimpleNamespace over the functions, so call sites such as
+    sched.Product.create("Widget") are unchanged; every member is also
+    published as a flat function, e.g. product_create.
+    """
+    # create is memoized so repeated names do not cross into C#; the cache is
+    # cleared whenever the matching remove wrapper is called. Calling the C#
+    # Product.Clear(), Location.Clear() or ProductLocation.Clear() directly
+    # bypasses this and leaves the caches stale.
+    product_create = lru_cache(maxsize=4096)(CSharpProduct.Create)
+
+    def product_remove(name: str) -> bool:
         """Remove a product by name."""
+        product_create.cache_clear()
         return CSharpProduct.Remove(name)
-    
-    @staticmethod
-    def exists(name: str) -> bool:
-        """Check if a product exists."""
-        return CSharpProduct.Exists(name)
-    
-    @staticmethod
-    def get_all():
+
+    def product_get_all():
         """Get all products."""
-        return list(CSharpProduct.GetAll())
+        return list(CSharpProduct.GetAllArray())
 
+    def product_get_all_names():
+        """Get the names of all products (no per-product proxy objects)."""
+        return list(CSharpProduct.GetAllNames())
 
-class Location:
-    """Python wrapper for C# Location class."""
-    
-    @staticmethod
-    def create(name: str):
-        """Create a new location or get existing one."""
-        return CSharpLocation.Create(name)
-    
-    @staticmethod
-    def get(name: str):
-        """Get a location by name."""
-        return CSharpLocation.Get(name)
-    
-    @staticmethod
-    def remove(name: str) -> bool:
+    location_create = lru_cache(maxsize=4096)(CSharpLocation.Create)
+
+    def location_remove(name: str) -> bool:
         """Remove a location by name."""
+        location_create.cache_clear()
         return CSharpLocation.Remove(name)
-    
-    @staticmethod
-    def exists(name: str) -> bool:
-        """Check if a location exists."""
-        return CSharpLocation.Exists(name)
-    
-    @staticmethod
-    def get_all():
+
+    def location_get_all():
         """Get all locations."""
-        return list(CSharpLocation.GetAll())
+        return list(CSharpLocation.GetAllArray())
 
+    def location_get_all_names():
+        """Get the names of all locations."""
+        return list(CSharpLocation.GetAllNames())
 
-class ProductLocation:
-    """Python wrapper for C# ProductLocation class."""
-    
-    @staticmethod
-    def create(product_name: str, location_name: str):
-        """Create a new ProductLocation or get existing one."""
+    @lru_cache(maxsize=4096)
+    def product_location_create(product_name: str, location_name: str):
+        """Create a new ProductLocation or get existing one (memoized until a removal)."""
         return CSharpProductLocation.Create(product_name, location_name)
-    
-    @staticmethod
-    def get(product_name: str, location_name: str):
+
+    def product_location_get(product_name: str, location_name: str):
         """Get a ProductLocation by product and location names."""
         return CSharpProductLocation.Get(product_name, location_name)
-    
-    @staticmethod
-    def get_by_key(key: str):
-        """Get a ProductLocation by key (format: 'product@location')."""
-        return CSharpProductLocation.GetByKey(key)
-    
-    @staticmethod
-    def remove(product_name: str, location_name: str) -> bool:
+
+    def product_location_remove(product_name: str, location_name: str) -> bool:
         """Remove a ProductLocation."""
+        product_location_create.cache_clear()
         return CSharpProductLocation.Remove(product_name, location_name)
-    
-    @staticmethod
-    def exists(product_name: str, location_name: str) -> bool:
+
+    def product_location_exists(product_name: str, location_name: str) -> bool:
         """Check if a ProductLocation exists."""
         return CSharpProductLocation.Exists(product_name, location_name)
-    
-    @staticmethod
-    def get_all():
+
+    def product_location_get_all():
         """Get all ProductLocations."""
-        return list(CSharpProductLocation.GetAll())
-    
-    @staticmethod
-    def get_by_product(product_name: str):
-        """Get all ProductLocations for a specific product."""
-        return list(CSharpProductLocation.GetByProduct(product_name))
-    
-    @staticmethod
-    def get_by_location(location_name: str):
-        """Get all ProductLocations for a specific location."""
-        return list(CSharpProductLocation.GetByLocation(location_name))
+        return list(CSharpProductLocation.GetAllArray())
+
+    def product_location_get_by_product(product_name: str):
+        """
+        Iterate over the ProductLocations for a specific product.
+
+        Returns the lazy C# enumerable; use get_by_product_list() when a list is needed.
+        """
+        return CSharpProductLocation.GetByProduct(product_name)
 
+    def product_location_get_by_product_list(product_name: str):
+        """Get all ProductLocations for a specific product as a list."""
+        return list(CSharpProductLocation.GetByProductArray(product_name))
 
-def python_datetime_to_csharp(dt: datetime) -> CSharpDateTime:
+    def product_location_get_by_location(location_name: str):
+        """
+        Iterate over the ProductLocations for a specific location.
+
+        Returns the lazy C# enumerable; use get_by_location_list() when a list is needed.
+        """
+        return CSharpProductLocation.GetByLocation(location_name)
+
+    def product_location_get_by_location_list(location_name: str):
+        """Get all ProductLocations for a specific location as a list."""
+        return list(CSharpProductLocation.GetByLocationArray(location_name))
+
+    namespaces = {
+        "product": _ProductNamespace(
+            create=product_create,
+            get=CSharpProduct.Get,
+            remove=product_remove,
+            exists=CSharpProduct.Exists,
+            get_all=product_get_all,
+            get_all_names=product_get_all_names,
+        ),
+        "location": _LocationNamespace(
+            create=location_create,
+            get=CSharpLocation.Get,
+            remove=location_remove,
+            exists=CSharpLocation.Exists,
+            get_all=location_get_all,
+            get_all_names=location_get_all_names,
+        ),
+        "product_location": _ProductLocationNamespace(
+            create=product_location_create,
+            get=product_location_get,
+            get_by_key=CSharpProductLocation.GetByKey,
+            remove=product_location_remove,
+            exists=product_location_exists,
+            get_all=product_location_get_all,
+            get_by_product=product_location_get_by_product,
+            get_by_product_list=product_location_get_by_product_list,
+            get_by_location=product_location_get_by_location,
+            get_by_location_list=product_location_get_by_location_list,
+        ),
+    }
+    api = {
+        "Product": namespaces["product"],
+        "Location": namespaces["location"],
+        "ProductLocation": namespaces["product_location"],
+    }
+    for prefix, namespace in namespaces.items():
+        api.update({f"{prefix}_{member}": func for member, func in vars(namespace).items()})
+    return api
+
+
+# Names published by _bind_api(), filled in when the runtime is loaded
+_RUNTIME_EXPORTS = frozenset()
+
+
+def __getattr__(name: str):
+    # The wrappers only exist once the runtime is loaded, so the first access
+    # to any public name that is not defined yet loads it (PEP 562)
+    if not name.startswith("_") and not _runtime_loaded:
+        _ensure_runtime()
+        if name in _RUNTIME_EXPORTS:
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def python_datetime_to_csharp(dt: datetime) -> "CSharpDateTime":
     """Convert Python datetime to C# DateTime."""
-    return CSharpDateTime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond // 1000)
+    # DateTime(long ticks) is the only one-argument constructor, so pythonnet
+    # resolves it without weighing the seven-int field overloads
+    _ensure_runtime()
+    return CSharpDateTime(_to_ticks(dt))
 
 
-def csharp_datetime_to_python(dt: CSharpDateTime) -> datetime:
+def csharp_datetime_to_python(dt: "CSharpDateTime") -> datetime:
     """Convert C# DateTime to Python datetime."""
-    return datetime(dt.Year, dt.Month, dt.Day, dt.Hour, dt.Minute, dt.Second, dt.Millisecond * 1000)
+    return _ticks_to_python(dt.Ticks)
+
+
+def _copy_clr_array(values, typecode: str) -> array:
+    """
+    Copy a primitive C# array (long[] or double[]) into a Python array.
+
+    Uses a single Marshal.Copy into the Python buffer instead of fetching
+    every element across the interop boundary.
+    """
+    buffer = array(typecode, bytes(array(typecode).itemsize * values.Length))
+    if values.Length:
+        address, _ = buffer.buffer_info()
+        Marshal.Copy(values, 0, IntPtr(address), values.Length)
+    return buffer
+
+
+def _to_clr_array(values: array, element_type):
+    """
+    Copy a Python array of int64 ('q') or float ('d') values into a new C#
+    array with a single Marshal.Copy.
+    """
+    result = Array[element_type](len(values))
+    if values:
+        address, _ = values.buffer_info()
+        Marshal.Copy(IntPtr(address), result, 0, len(values))
+    return result
+
+
+def _to_ticks(dt: datetime) -> int:
+    """
+    Convert Python datetime to C# DateTime ticks.
+
+    Ticks are the wire format for the inventory helpers: passing a plain int
+    avoids constructing a System.DateTime on every call. Like
+    python_datetime_to_csharp, any tzinfo is ignored.
+
+    This is on every inventory call, so it is written as integer arithmetic on
+    the date fields rather than subtracting _TICKS_EPOCH, which would allocate
+    two intermediate objects per call.
+    """
+    seconds = (dt.toordinal() - 1) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return seconds * 10_000_000 + dt.microsecond * 10
+
+
+def _ticks_to_python(ticks: int) -> datetime:
+    """Convert C# DateTime ticks to Python datetime (microsecond resolution)."""
+    return _TICKS_EPOCH + timedelta(microseconds=ticks // 10)
 
 
 # Helper functions for inventory management
 def add_inventory(product_location, time: datetime, quantity: float):
     """Add inventory to a ProductLocation at a specific time."""
-    cs_time = python_datetime_to_csharp(time)
-    product_location.AddInventory(cs_time, quantity)
+    _INVENTORY_OPS["add"](product_location, _to_ticks(time), quantity)
+
+
+def add_inventory_batch(product_location, times: Iterable[datetime], quantities: Iterable[float]):
+    """
+    Add many inventory receipts to a ProductLocation in one call to C#.
+
+    times and quantities are matched by position and must have the same length.
+    """
+    ticks = array("q", [_to_ticks(t) for t in times])
+    quantities = array("d", quantities)
+    product_location.AddInventoryBatch(_to_clr_array(ticks, Int64), _to_clr_array(quantities, Double))
+
+
+def add_inventory_linear(product_location, base: datetime, step: timedelta, quantities: Iterable[float]):
+    """
+    Add inventory on an equally spaced schedule in one call to C#.
+
+    quantities[i] is added at base + i * step; the times are generated on the
+    C# side, so no per-sample datetime is built or converted in Python.
+    """
+    quantities = array("d", quantities)
+    product_location.AddInventoryLinear(
+        _to_ticks(base), step // _ONE_MICROSECOND * 10, _to_clr_array(quantities, Double)
+    )
 
 
 def remove_inventory(product_location, time: datetime, quantity: float):
     """Remove inventory from a ProductLocation at a specific time."""
-    cs_time = python_datetime_to_csharp(time)
-    product_location.RemoveInventory(cs_time, quantity)
+    _INVENTORY_OPS["remove"](product_location, _to_ticks(time), quantity)
 
 
 def update_inventory(product_location, time: datetime, net_change: float):
     """Update inventory change at a specific time."""
-    cs_time = python_datetime_to_csharp(time)
-    product_location.UpdateInventory(cs_time, net_change)
+    _INVENTORY_OPS["update"](product_location, _to_ticks(time), net_change)
 
 
 def get_cumulative_inventory(product_location, time: datetime) -> float:
     """Get cumulative inventory at a specific time."""
-    cs_time = python_datetime_to_csharp(time)
-    return product_location.GetCumulativeInventory(cs_time)
+    return product_location.GetCumulativeInventory(_to_ticks(time))
 
 
 def get_inventory_change_at_time(product_location, time: datetime) -> float:
     """Get inventory change at a specific time."""
-    cs_time = python_datetime_to_csharp(time)
-    return product_location.GetInventoryChangeAtTime(cs_time)
+    return product_location.GetInventoryChangeAtTime(_to_ticks(time))
 
 
 def get_all_inventory_changes(product_location):
     """Get all inventory changes for a ProductLocation."""
-    changes = product_location.GetAllInventoryChanges()
-    return [(csharp_datetime_to_python(item.Item1), item.Item2) for item in changes]
+    ticks, deltas = product_location.GetAllInventoryChangesTicks(None, None)
+    ticks = _copy_clr_array(ticks, "q")
+    deltas = _copy_clr_array(deltas, "d")
+    return [(_ticks_to_python(t), delta) for t, delta in zip(ticks, deltas)]
+
+
+def get_all_inventory_changes_raw(product_location) -> List[Tuple[int, float]]:
+    """
+    Get all inventory changes for a ProductLocation as (ticks, net_change) tuples.
+
+    Skips building a datetime per change, for callers that only aggregate or
+    format the results; use ticks_to_iso() to display a tick value.
+    """
+    ticks, deltas = product_location.GetAllInventoryChangesTicks(None, None)
+    return list(zip(_copy_clr_array(ticks, "q"), _copy_clr_array(deltas, "d")))
+
+
+def ticks_to_iso(ticks: int, sep: str = "T") -> str:
+    """Format C# DateTime ticks as an ISO 8601 string."""
+    return _ticks_to_python(ticks).isoformat(sep)
 
 
 def get_inventory_changes_in_range(product_location, start_time: datetime, end_time: datetime):
     """Get inventory changes within a time range."""
-    cs_start = python_datetime_to_csharp(start_time)
-    cs_end = python_datetime_to_csharp(end_time)
-    changes = product_location.GetInventoryChangesInRange(cs_start, cs_end)
-    return [(csharp_datetime_to_python(item.Item1), item.Item2) for item in changes]
+    ticks, deltas = product_location.GetInventoryChangesInRangeTicks(
+        _to_ticks(start_time), _to_ticks(end_time), None, None
+    )
+    ticks = _copy_clr_array(ticks, "q")
+    deltas = _copy_clr_array(deltas, "d")
+    return [(_ticks_to_python(t), delta) for t, delta in zip(ticks, deltas)]
 
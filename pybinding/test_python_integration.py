@@ -2,34 +2,47 @@
 Quick test to verify Python integration with C# models.
 """
 
+import sys
+
 import scheduling_py as sched
-from datetime import datetime
+from datetime import datetime, timedelta
 
 def test_basic_operations():
     """Test basic Product, Location, and ProductLocation operations."""
     
     print("Testing Python Integration...")
     
+    # Importing the module must not start the .NET runtime
+    assert not sched._runtime_loaded and "clr" not in sys.modules
+
     # Test Product
     print("\n1. Testing Product...")
     p = sched.Product.create("TestProduct")
-    assert p.Name == "TestProduct"
+    # Read C# properties once into locals so each assert compares Python values
+    name = p.Name
+    assert name == "TestProduct"
     assert sched.Product.exists("TestProduct")
     print("   ✓ Product creation works!")
     
     # Test Location
     print("\n2. Testing Location...")
     l = sched.Location.create("TestLocation")
-    assert l.Name == "TestLocation"
+    name = l.Name
+    assert name == "TestLocation"
     assert sched.Location.exists("TestLocation")
     print("   ✓ Location creation works!")
     
     # Test ProductLocation
     print("\n3. Testing ProductLocation...")
     pl = sched.ProductLocation.create("TestProduct", "TestLocation")
-    assert pl.Key == "TestProduct@TestLocation"
-    assert pl.ProductName == "TestProduct"
-    assert pl.LocationName == "TestLocation"
+    key, product_name, location_name = pl.Key, pl.ProductName, pl.LocationName
+    assert key == "TestProduct@TestLocation"
+    assert product_name == "TestProduct"
+    assert location_name == "TestLocation"
+    assert sched.ProductLocation.create(product_name="TestProduct", location_name="TestLocation").Key == key
+    assert sched.ProductLocation.exists(product_name="TestProduct", location_name="TestLocation")
+    assert sched.ProductLocation.get_by_key(key=key).Key == key
+    assert sched.Product.exists(name="TestProduct") and sched.Location.exists(name="TestLocation")
     print("   ✓ ProductLocation creation works!")
     
     # Test Inventory
@@ -45,6 +58,75 @@ def test_basic_operations():
     cumulative = sched.get_cumulative_inventory(pl, test_time)
     assert cumulative == 70
     print(f"   ✓ Remove inventory works! Cumulative: {cumulative}")
+
+    sched.update_inventory(pl, test_time, 90)
+    change = sched.get_inventory_change_at_time(pl, test_time)
+    assert change == 90
+    print(f"   ✓ Update inventory works! Change: {change}")
+
+    range_changes = sched.get_inventory_changes_in_range(pl, test_time, test_time + timedelta(hours=1))
+    assert range_changes == [(test_time, 90)]
+    all_changes = sched.get_all_inventory_changes(pl)
+    assert all_changes == [(test_time, 90)]
+    print(f"   ✓ Inventory change queries work! Changes: {all_changes}")
+
+    # Test batch inventory
+    print("\n5. Testing batch inventory...")
+    batch_time = datetime(2024, 1, 2, 12, 0, 0)
+    sched.add_inventory_batch(pl, [batch_time, batch_time + timedelta(hours=1)], [10, 20])
+    cumulative = sched.get_cumulative_inventory(pl, batch_time + timedelta(hours=1))
+    assert cumulative == 120
+    print(f"   ✓ Batch inventory works! Cumulative: {cumulative}")
+
+    # Test datetime conversion
+    print("\n6. Testing datetime conversion...")
+    precise_time = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    cs_time = sched.python_datetime_to_csharp(precise_time)
+    round_trip = sched.csharp_datetime_to_python(cs_time)
+    assert round_trip == precise_time
+    print(f"   ✓ Datetime round trip keeps microseconds! {round_trip}")
+    
+    # Test the remaining helpers on a fresh ProductLocation
+    print("\n7. Testing bulk and listing helpers...")
+    spl = sched.ProductLocation.create("SmokeProduct", "SmokeLocation")
+    base = datetime(2024, 2, 1, 8, 0, 0)
+    sched.add_inventory_linear(spl, base, timedelta(hours=1), [5, 15])
+    assert sched.get_all_inventory_changes(spl) == [(base, 5), (base + timedelta(hours=1), 15)]
+
+    raw = sched.get_all_inventory_changes_raw(spl)
+    assert [delta for _, delta in raw] == [5, 15]
+    assert sched.ticks_to_iso(raw[0][0]) == "2024-02-01T08:00:00"
+    assert sched.ticks_to_iso(raw[1][0], sep=" ") == "2024-02-01 09:00:00"
+
+    assert [x.Key for x in sched.ProductLocation.get_by_product_list("SmokeProduct")] == ["SmokeProduct@SmokeLocation"]
+    assert [x.Key for x in sched.ProductLocation.get_by_location_list("SmokeLocation")] == ["SmokeProduct@SmokeLocation"]
+    assert "SmokeProduct" in sched.Product.get_all_names()
+    assert "SmokeLocation" in sched.Location.get_all_names()
+    print("   ✓ Linear inventory, raw changes and listing helpers work!")
+
+    # Test create memoization and its invalidation on remove
+    print("\n8. Testing create memoization...")
+    from System import Object  # the .NET runtime is loaded by now
+
+    cached = sched.Product.create("CachedProduct")
+    assert sched.Product.create("CachedProduct") is cached
+    assert sched.Product.remove("CachedProduct")
+    assert not sched.Product.exists("CachedProduct")
+    recreated = sched.Product.create("CachedProduct")
+    assert not Object.ReferenceEquals(cached, recreated)
+
+    cached = sched.Location.create("CachedLocation")
+    assert sched.Location.remove("CachedLocation")
+    assert not sched.Location.exists("CachedLocation")
+    assert not Object.ReferenceEquals(cached, sched.Location.create("CachedLocation"))
+
+    cached = sched.ProductLocation.create("CachedProduct", "CachedLocation")
+    assert sched.ProductLocation.create("CachedProduct", "CachedLocation") is cached
+    assert sched.ProductLocation.remove("CachedProduct", "CachedLocation")
+    assert not sched.ProductLocation.exists("CachedProduct", "CachedLocation")
+    recreated = sched.ProductLocation.create("CachedProduct", "CachedLocation")
+    assert not Object.ReferenceEquals(cached, recreated)
+    print("   ✓ create is memoized and remove invalidates it!")
     
     print("\n✅ All tests passed!")
     print("\nYou can now use the C# models from Python!")